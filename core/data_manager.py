@@ -1,4 +1,6 @@
 import csv
+from functools import cached_property
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -20,170 +22,286 @@ class DataManager:
         self._initialized = True
         self.base_path = Path(__file__).parent.parent / 'data'
 
-        # Data structures
-        self.life_expectancy: Dict[int, float] = {}
-        self.first_names: Dict[Tuple[str, str], List[Tuple[str, float]]] = {}
-        self.gender_probabilities: Dict[str, Dict[str, float]] = {}
-        self.last_names: Dict[str, List[Tuple[str, int]]] = {}
-        self.rank_probabilities: List[float] = []
-        self.birth_rates: Dict[str, float] = {}
-        self.marriage_rates: Dict[str, float] = {}
-
-        self._load_all_data()
-
-    def _load_all_data(self):
-        """Load all CSV files."""
-        self._load_life_expectancy()
-        self._load_first_names()
-        self._load_gender_probabilities()
-        self._load_last_names()
-        self._load_rank_probabilities()
-        self._load_birth_and_marriage_rates()
-
-    def _load_life_expectancy(self):
-        """Load life expectancy data."""
-        path = self.base_path / 'life_expectancy.csv'
-        with open(path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                year = int(row['Year'])
-                expectancy = float(row['Period life expectancy at birth'])
-                self.life_expectancy[year] = expectancy
+        # Memoized lookups (resolved once per requested key)
+        self._life_expectancy_cache: Dict[int, float] = {}
 
-    def _load_first_names(self):
-        """Load first names with frequencies by decade and gender."""
-        path = self.base_path / 'first_names.csv'
-        with open(path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                name = row['name']
-                decade = row['decade']
-                gender = row['gender']
-                frequency = float(row['frequency'])
+    def load_all(self):
+        """Read every CSV file now instead of on first access."""
+        for name in ('life_expectancy', 'first_names', 'gender_probabilities',
+                     'last_names', 'rank_probabilities', 'birth_rates', 'marriage_rates'):
+            getattr(self, name)
 
-                key = (decade, gender)
-                if key not in self.first_names:
-                    self.first_names[key] = []
-                self.first_names[key].append((name, frequency))
+    # Each data set is read from its CSV the first time it is accessed
 
-    def _load_gender_probabilities(self):
-        """Load gender probabilities by decade."""
-        path = self.base_path / 'gender_name_probability.csv'
-        with open(path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                decade = row['decade']
-                gender = row['gender']
-                probability = float(row['probability'])
+    @cached_property
+    def life_expectancy(self) -> Dict[int, float]:
+        """Life expectancy at birth by year."""
+        return self._load_life_expectancy()
 
-                if decade not in self.gender_probabilities:
-                    self.gender_probabilities[decade] = {}
-                self.gender_probabilities[decade][gender] = probability
+    @cached_property
+    def first_names(self) -> Dict[Tuple[str, str], List[Tuple[str, float]]]:
+        """First names with frequencies by (decade, gender)."""
+        return self._load_first_names()
 
-    def _load_last_names(self):
-        """Load last names by decade with ranks."""
-        path = self.base_path / 'last_names.csv'
-        with open(path, 'r') as f:
-            reader = csv.DictReader(f)
+    @cached_property
+    def gender_probabilities(self) -> Dict[str, Dict[str, float]]:
+        """Gender probabilities by decade."""
+        return self._load_gender_probabilities()
+
+    @cached_property
+    def last_names(self) -> Dict[str, List[Tuple[str, int]]]:
+        """Last names with ranks by decade."""
+        return self._load_last_names()
+
+    @cached_property
+    def rank_probabilities(self) -> List[float]:
+        """Probability for each last-name rank (index 0 is rank 1)."""
+        return self._load_rank_probabilities()
+
+    @cached_property
+    def birth_rates(self) -> Dict[str, float]:
+        """Birth rates by decade."""
+        return self._birth_and_marriage_rates[0]
+
+    @cached_property
+    def marriage_rates(self) -> Dict[str, float]:
+        """Marriage rates by decade."""
+        return self._birth_and_marriage_rates[1]
+
+    @cached_property
+    def _birth_and_marriage_rates(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Birth and marriage rates, which share a single CSV file."""
+        return self._load_birth_and_marriage_rates()
+
+    @cached_property
+    def first_names_cum(self) -> Dict[Tuple[str, str], Tuple[Tuple[str, ...], Tuple[float, ...]]]:
+        """Parallel (names, cumulative frequencies) tuples by (decade, gender)."""
+        return {key: self._cumulate(items) for key, items in self.first_names.items()}
+
+    @cached_property
+    def last_names_weighted(self) -> Dict[str, Tuple[Tuple[str, ...], Tuple[float, ...], Tuple[float, ...]]]:
+        """Parallel (names, rank probabilities, cumulative rank probabilities) tuples by decade."""
+        rank_probabilities = self.rank_probabilities
+        weighted = {}
+        for decade, names_ranks in self.last_names.items():
+            # Apply rank probabilities, skipping ranks beyond the probability table
+            items = [
+                (name, rank_probabilities[rank - 1])
+                for name, rank in names_ranks
+                if 1 <= rank <= len(rank_probabilities)
+            ]
+            names, cum_weights = self._cumulate(items)
+            weights = tuple(weight for _, weight in items)
+            weighted[decade] = (names, weights, cum_weights)
+        return weighted
+
+    @cached_property
+    def _last_names_items(self) -> Dict[str, List[Tuple[str, float]]]:
+        """(name, rank probability) lists by decade, as returned by get_last_names."""
+        return {
+            decade: list(zip(names, weights))
+            for decade, (names, weights, _) in self.last_names_weighted.items()
+        }
+
+    @cached_property
+    def p_male(self) -> Dict[str, float]:
+        """Normalized probability of a male child by decade."""
+        return {decade: self._male_share(probs) for decade, probs in self.gender_probabilities.items()}
+
+    # Nearest-available-decade tables, built once per data set
+
+    @cached_property
+    def _first_names_resolve(self) -> Dict[str, Dict[str, str]]:
+        """Decade resolution table per gender for first names."""
+        genders = {gender for _, gender in self.first_names}
+        return {
+            gender: self._decade_table(d for d, g in self.first_names if g == gender)
+            for gender in genders
+        }
+
+    @cached_property
+    def _gender_resolve(self) -> Dict[str, str]:
+        """Decade resolution table for gender probabilities."""
+        return self._decade_table(self.gender_probabilities)
+
+    @cached_property
+    def _last_names_resolve(self) -> Dict[str, str]:
+        """Decade resolution table for last names."""
+        return self._decade_table(self.last_names)
+
+    @cached_property
+    def _birth_rates_resolve(self) -> Dict[str, str]:
+        """Decade resolution table for birth rates."""
+        return self._decade_table(self.birth_rates)
+
+    @cached_property
+    def _marriage_rates_resolve(self) -> Dict[str, str]:
+        """Decade resolution table for marriage rates."""
+        return self._decade_table(self.marriage_rates)
+
+    def _read_columns(self, filename: str) -> Dict[str, Tuple[str, ...]]:
+        """Read a CSV file into a mapping of header name to column values."""
+        path = self.base_path / filename
+        with open(path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = []
             for row in reader:
-                decade = row['Decade']
-                last_name = row['LastName']
-                rank = int(row['Rank'])
+                # Skip blank lines, which csv.reader returns as empty rows
+                if not row:
+                    continue
+                if len(row) != len(header):
+                    raise ValueError(
+                        f"{path}: line {reader.line_num} has {len(row)} fields, expected {len(header)}"
+                    )
+                rows.append(row)
+        columns = list(zip(*rows))
+        if not columns:
+            columns = [()] * len(header)
+        return dict(zip(header, columns))
+
+    def _load_life_expectancy(self) -> Dict[int, float]:
+        """Load life expectancy data."""
+        columns = self._read_columns('life_expectancy.csv')
+        return dict(zip(
+            map(int, columns['Year']),
+            map(float, columns['Period life expectancy at birth'])
+        ))
 
-                if decade not in self.last_names:
-                    self.last_names[decade] = []
-                self.last_names[decade].append((last_name, rank))
+    def _load_first_names(self) -> Dict[Tuple[str, str], List[Tuple[str, float]]]:
+        """Load first names with frequencies by decade and gender."""
+        columns = self._read_columns('first_names.csv')
+        first_names: Dict[Tuple[str, str], List[Tuple[str, float]]] = {}
+        rows = zip(columns['decade'], columns['gender'], columns['name'], map(float, columns['frequency']))
+        for decade, gender, name, frequency in rows:
+            first_names.setdefault((decade, gender), []).append((name, frequency))
+        return first_names
 
-    def _load_rank_probabilities(self):
+    def _load_gender_probabilities(self) -> Dict[str, Dict[str, float]]:
+        """Load gender probabilities by decade."""
+        columns = self._read_columns('gender_name_probability.csv')
+        gender_probabilities: Dict[str, Dict[str, float]] = {}
+        rows = zip(columns['decade'], columns['gender'], map(float, columns['probability']))
+        for decade, gender, probability in rows:
+            gender_probabilities.setdefault(decade, {})[gender] = probability
+        return gender_probabilities
+
+    def _load_last_names(self) -> Dict[str, List[Tuple[str, int]]]:
+        """Load last names by decade with ranks."""
+        columns = self._read_columns('last_names.csv')
+        last_names: Dict[str, List[Tuple[str, int]]] = {}
+        rows = zip(columns['Decade'], columns['LastName'], map(int, columns['Rank']))
+        for decade, last_name, rank in rows:
+            last_names.setdefault(decade, []).append((last_name, rank))
+        return last_names
+
+    def _load_rank_probabilities(self) -> List[float]:
         """Load rank-to-probability mappings."""
         path = self.base_path / 'rank_to_probability.csv'
         with open(path, 'r') as f:
             # This CSV has no header, just comma-separated probabilities in one line
             content = f.read().strip()
-            probabilities = content.split(',')
-            for prob_str in probabilities:
-                prob = float(prob_str)
-                self.rank_probabilities.append(prob)
+        return [float(prob) for prob in content.split(',')]
 
-    def _load_birth_and_marriage_rates(self):
+    def _load_birth_and_marriage_rates(self) -> Tuple[Dict[str, float], Dict[str, float]]:
         """Load birth and marriage rates by decade."""
-        path = self.base_path / 'birth_and_marriage_rates.csv'
-        with open(path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                decade = row['decade']
-                birth_rate = float(row['birth_rate'])
-                marriage_rate = float(row['marriage_rate'])
-                self.birth_rates[decade] = birth_rate
-                self.marriage_rates[decade] = marriage_rate
+        columns = self._read_columns('birth_and_marriage_rates.csv')
+        decades = columns['decade']
+        birth_rates = dict(zip(decades, map(float, columns['birth_rate'])))
+        marriage_rates = dict(zip(decades, map(float, columns['marriage_rate'])))
+        return birth_rates, marriage_rates
+
+    @staticmethod
+    def _male_share(probs: Dict[str, float]) -> float:
+        """Get the male share of a {'male': p, 'female': q} mapping."""
+        return probs['male'] / (probs['male'] + probs['female'])
+
+    @staticmethod
+    def _cumulate(items: List[Tuple[str, float]]) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+        """Turn [(name, weight), ...] into ((names...), (running weight totals...))."""
+        if not items:
+            return (), ()
+        names, weights = zip(*items)
+        return names, tuple(accumulate(weights))
+
+    @staticmethod
+    def _closest_decade(decade: str, available_decades) -> str:
+        """Find the available decade nearest to the requested one (e.g. '2130s' -> '2120s')."""
+        decade_num = int(decade[:-1])
+        return min(sorted(available_decades), key=lambda d: abs(int(d[:-1]) - decade_num))
+
+    @classmethod
+    def _decade_table(cls, available_decades) -> Dict[str, str]:
+        """Map each available decade to itself and every decade from 1900s to 2120s to its nearest one."""
+        available = sorted(available_decades)
+        table = {decade: decade for decade in available}
+        if not available:
+            return table
+        for year in range(1900, 2130, 10):
+            decade = f"{year}s"
+            if decade not in table:
+                table[decade] = cls._closest_decade(decade, available)
+        return table
+
+    def _resolve(self, table: Dict[str, str], decade: str) -> str:
+        """Resolve a decade through a table, extending it for decades outside the precomputed range."""
+        resolved = table.get(decade)
+        if resolved is None:
+            resolved = table[decade] = self._closest_decade(decade, set(table.values()))
+        return resolved
 
     def get_life_expectancy(self, year: int) -> float:
         """Get life expectancy for a given year."""
+        if year in self._life_expectancy_cache:
+            return self._life_expectancy_cache[year]
         # Find closest year in data
         if year in self.life_expectancy:
-            return self.life_expectancy[year]
-        # Fallback to nearest year
-        closest_year = min(self.life_expectancy.keys(), key=lambda y: abs(y - year))
-        return self.life_expectancy[closest_year]
+            result = self.life_expectancy[year]
+        else:
+            # Fallback to nearest year
+            closest_year = min(self.life_expectancy.keys(), key=lambda y: abs(y - year))
+            result = self.life_expectancy[closest_year]
+        self._life_expectancy_cache[year] = result
+        return result
 
     def get_first_names(self, decade: str, gender: str) -> List[Tuple[str, float]]:
         """Get list of (name, frequency) tuples for a decade and gender."""
-        key = (decade, gender)
-        if key in self.first_names:
-            return self.first_names[key]
-        # Fallback to nearest decade
-        available_decades = sorted(set(d for d, g in self.first_names.keys() if g == gender))
-        if not available_decades:
+        table = self._first_names_resolve.get(gender)
+        if not table:
             return []
-        decade_num = int(decade[:-1])
-        closest_decade = min(available_decades, key=lambda d: abs(int(d[:-1]) - decade_num))
-        return self.first_names.get((closest_decade, gender), [])
+        return self.first_names[(self._resolve(table, decade), gender)]
+
+    def get_first_name_cum_weights(self, decade: str, gender: str) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+        """Get parallel (names, cumulative frequencies) tuples for a decade and gender."""
+        table = self._first_names_resolve.get(gender)
+        if not table:
+            return (), ()
+        return self.first_names_cum[(self._resolve(table, decade), gender)]
 
     def get_gender_probabilities(self, decade: str) -> Dict[str, float]:
         """Get gender probabilities for a decade."""
-        if decade in self.gender_probabilities:
-            return self.gender_probabilities[decade]
-        # Fallback to nearest decade
-        available_decades = sorted(self.gender_probabilities.keys())
-        if not available_decades:
+        if not self.gender_probabilities:
             return {'male': 0.5, 'female': 0.5}
-        decade_num = int(decade[:-1])
-        closest_decade = min(available_decades, key=lambda d: abs(int(d[:-1]) - decade_num))
-        return self.gender_probabilities[closest_decade]
+        return self.gender_probabilities[self._resolve(self._gender_resolve, decade)]
+
+    def get_male_probability(self, decade: str) -> float:
+        """Get the normalized probability that a person born in a decade is male."""
+        if not self.p_male:
+            return 0.5
+        return self.p_male[self._resolve(self._gender_resolve, decade)]
 
     def get_last_names(self, decade: str) -> List[Tuple[str, float]]:
         """Get list of (name, probability) tuples for a decade."""
-        if decade not in self.last_names:
-            # Fallback to nearest decade
-            available_decades = sorted(self.last_names.keys())
-            decade_num = int(decade[:-1])
-            decade = min(available_decades, key=lambda d: abs(int(d[:-1]) - decade_num))
-
-        names_ranks = self.last_names[decade]
-        # Apply rank probabilities
-        result = []
-        for name, rank in names_ranks:
-            if 1 <= rank <= len(self.rank_probabilities):
-                prob = self.rank_probabilities[rank - 1]
-                result.append((name, prob))
-        return result
+        return self._last_names_items[self._resolve(self._last_names_resolve, decade)]
+
+    def get_last_name_weights(self, decade: str) -> Tuple[Tuple[str, ...], Tuple[float, ...], Tuple[float, ...]]:
+        """Get parallel (names, probabilities, cumulative probabilities) tuples for a decade."""
+        return self.last_names_weighted[self._resolve(self._last_names_resolve, decade)]
 
     def get_birth_rate(self, decade: str) -> float:
         """Get birth rate for a decade."""
-        if decade in self.birth_rates:
-            return self.birth_rates[decade]
-        # Fallback to nearest decade
-        available_decades = sorted(self.birth_rates.keys())
-        decade_num = int(decade[:-1])
-        closest_decade = min(available_decades, key=lambda d: abs(int(d[:-1]) - decade_num))
-        return self.birth_rates[closest_decade]
+        return self.birth_rates[self._resolve(self._birth_rates_resolve, decade)]
 
     def get_marriage_rate(self, decade: str) -> float:
         """Get marriage rate for a decade."""
-        if decade in self.marriage_rates:
-            return self.marriage_rates[decade]
-        # Fallback to nearest decade
-        available_decades = sorted(self.marriage_rates.keys())
-        decade_num = int(decade[:-1])
-        closest_decade = min(available_decades, key=lambda d: abs(int(d[:-1]) - decade_num))
-        return self.marriage_rates[closest_decade]
+        return self.marriage_rates[self._resolve(self._marriage_rates_resolve, decade)]
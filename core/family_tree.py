@@ -1,4 +1,7 @@
-from typing import List
+from array import array
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, List, Optional
 from models.person import Person
 
 
@@ -7,16 +10,43 @@ class FamilyTree:
 
     def __init__(self):
         self.founders: List[Person] = []
-        self.all_people: List[Person] = []
+        self.all_people: List[Person] = []  # May hold None padding from reserve() until finalize()
+
+        # Column-oriented copies of the attributes queries scan over,
+        # kept parallel to all_people
+        self.years_born: array = array('i')
+        self.first_names: List[str] = []
+        self.last_names: List[str] = []
+
+        # Child lists by parent ID, built on demand by children_of()
+        self._children_index: Optional[Dict[int, List[Person]]] = None
 
     def add_founder(self, person: Person):
         """Add a founder to the tree."""
         self.founders.append(person)
-        self.all_people.append(person)
+        self.add_person(person)
+
+    def reserve(self, n: int):
+        """Pre-size all_people for about n people so adding them fills slots instead of growing the list."""
+        if n > len(self.all_people):
+            self.all_people.extend([None] * (n - len(self.all_people)))
+
+    def finalize(self):
+        """Drop any reserved slots that were not filled."""
+        del self.all_people[len(self.years_born):]
 
     def add_person(self, person: Person):
         """Add a person to the tree."""
-        self.all_people.append(person)
+        # years_born holds one entry per person added, so its length is the next free slot
+        size = len(self.years_born)
+        if size < len(self.all_people):
+            self.all_people[size] = person
+        else:
+            self.all_people.append(person)
+        self.years_born.append(person.year_born)
+        self.first_names.append(person.first_name)
+        self.last_names.append(person.last_name)
+        self._children_index = None
 
     def get_all_people(self) -> List[Person]:
         """Get all people in the tree."""
@@ -26,6 +56,18 @@ class FamilyTree:
         """Get the founder persons."""
         return self.founders
 
+    def children_of(self, person_id: int) -> List[Person]:
+        """Get the children of a person, indexing all parent links on first use."""
+        if self._children_index is None:
+            index = defaultdict(list)
+            for person in islice(self.all_people, len(self.years_born)):
+                if person.parent1 is not None:
+                    index[person.parent1.id].append(person)
+                if person.parent2 is not None:
+                    index[person.parent2.id].append(person)
+            self._children_index = index
+        return self._children_index.get(person_id, [])
+
     def get_total_count(self) -> int:
         """Get total number of people in the tree."""
-        return len(self.all_people)
+        return len(self.years_born)
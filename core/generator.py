@@ -1,6 +1,5 @@
 import math
 import random
-from collections import deque
 from typing import List, Optional, Tuple
 from models.person import Person
 from core.family_tree import FamilyTree
@@ -20,6 +19,16 @@ class FamilyTreeGenerator:
 
     def generate(self) -> FamilyTree:
         """Generate the complete family tree."""
+        self.tree.reserve(self._estimate_tree_size())
+        try:
+            self._populate()
+        finally:
+            # Trim unused reserved slots even if generation stops partway
+            self.tree.finalize()
+        return self.tree
+
+    def _populate(self):
+        """Create the founders and then every following generation, breadth-first."""
         # Create two founders born in 1950
         founder1 = self.factory.create_founder()
         founder2 = self.factory.create_founder()
@@ -37,102 +46,101 @@ class FamilyTreeGenerator:
             founder1.partner = founder2
             founder2.partner = founder1
 
-        # Initialize queue with both founders — each generates independently
-        queue = deque([founder1, founder2])
-        processed = set()
+        # Process one generation at a time, starting with both founders —
+        # each generates independently. Every person is created into exactly
+        # one generation, so each generates their children exactly once.
+        current = [founder1, founder2]
+
+        # Bind hot-loop methods to locals once
+        rng_random = self.rng.random
+        get_marriage_rate = self.data_manager.get_marriage_rate
+        generate_children = self._generate_children
+        create_partner = self.factory.create_partner
+        tree_add = self.tree.add_person
+        family_add = self.family_ids.add
 
         # BFS generation
-        while queue:
-            person = queue.popleft()
+        while current:
+            new_children = []
 
-            # Skip if this person has already generated their children
-            if person.id in processed:
-                continue
-            processed.add(person.id)
+            # Draw every parent's birth-rate variation (uniform ±1.5) in one batch
+            variations = [-1.5 + 3.0 * rng_random() for _ in current]
 
-            # Generate children for this person
-            children = self._generate_children(person)
+            for person, variation in zip(current, variations):
+                # Generate children for this person
+                children = generate_children(person, variation)
 
-            for child in children:
-                self.tree.add_person(child)
-                person.children.append(child)
-                self.family_ids.add(child.id)
+                for child in children:
+                    tree_add(child)
+                    family_add(child.id)
 
-                # Determine if child finds a partner
-                child_decade = child.get_birth_decade()
-                marriage_rate = self.data_manager.get_marriage_rate(child_decade)
+                new_children.extend(children)
+
+            # Look up each marriage rate once per distinct decade in this generation,
+            # then decide every child's partnering from one batch of draws
+            marriage_rates = {
+                decade: get_marriage_rate(decade)
+                for decade in {child.birth_decade for child in new_children}
+            }
+            rolls = [rng_random() for _ in new_children]
 
-                if self.rng.random() < marriage_rate:
-                    partner = self.factory.create_partner(child)
+            next_generation = []
+            for child, roll in zip(new_children, rolls):
+                # Determine if child finds a partner
+                if roll < marriage_rates[child.birth_decade]:
+                    partner = create_partner(child)
                     child.partner = partner
                     partner.partner = child
-                    self.tree.add_person(partner)
+                    tree_add(partner)
                     # Partner also gets to generate their own children
-                    queue.append(partner)
+                    next_generation.append(partner)
 
-                # Add child to queue for next generation
-                queue.append(child)
+                # Add child to the next generation
+                next_generation.append(child)
 
-        return self.tree
+            current = next_generation
 
-    def _generate_children(self, person: Person) -> List[Person]:
-        """Generate children for a person."""
+    def _estimate_tree_size(self) -> int:
+        """Estimate the tree size, assuming a generation (children plus partners) every 35 years."""
+        total = generation = 2.0
+        for year in range(1950, 2120 - 25 + 1, 35):
+            decade = f"{(year // 10) * 10}s"
+            generation *= self.data_manager.get_birth_rate(decade) * (1 + self.data_manager.get_marriage_rate(decade))
+            total += generation
+        return int(total)
+
+    def _generate_children(self, person: Person, variation: float) -> List[Person]:
+        """Generate children for a person, given their pre-drawn birth-rate variation."""
         # Calculate number of children
-        num_children = self._calculate_num_children(person)
+        num_children = self._calculate_num_children(person, variation)
 
         if num_children <= 0:
             return []
 
+        partner = person.partner
+
         # Determine valid birth year range
-        if person.partner:
-            birth_years = self._distribute_birth_years(person, person.partner, num_children)
+        if partner:
+            birth_years = self._distribute_birth_years(person, partner, num_children)
         else:
             # Single parent case
             birth_years = self._distribute_birth_years_single(person, num_children)
 
-        # Create children
-        children = []
-        for year in birth_years:
-            # Check year limit
-            if year > 2120:
-                break
-
-            # Create child with both parents if partnered, otherwise single parent.
-            # Always pass the family-tree parent as parent1 so last names are inherited correctly.
-            if person.partner:
-                if person.id in self.family_ids:
-                    child = self.factory.create_child(person, person.partner, year)
-                else:
-                    child = self.factory.create_child(person.partner, person, year)
-            else:
-                # Single parent - create a placeholder partner with compatible birth year
-                # Partner must be age 25-45 when child is born
-                partner_birth_min = year - 45
-                partner_birth_max = year - 25
-                partner_birth = self.rng.randint(partner_birth_min, partner_birth_max)
-
-                temp_partner = Person(
-                    id=-1,  # Dummy ID
-                    first_name="Unknown",
-                    last_name="Unknown",
-                    gender="male" if person.gender == "female" else "female",
-                    year_born=partner_birth,
-                    year_died=None,
-                    generation=person.generation
-                )
-                child = self.factory.create_child(person, temp_partner, year)
-
-            children.append(child)
-
-        return children
-
-    def _calculate_num_children(self, person: Person) -> int:
-        """Calculate number of children based on birth rate."""
-        decade = person.get_birth_decade()
+        # Check year limit
+        birth_years = [year for year in birth_years if year <= 2120]
+
+        # Create children with both parents if partnered, otherwise single parent
+        # (parent2 is None). Always pass the family-tree parent as parent1 so
+        # last names are inherited correctly.
+        if partner and person.id not in self.family_ids:
+            return self.factory.create_children_batch(partner, person, birth_years)
+        return self.factory.create_children_batch(person, partner, birth_years)
+
+    def _calculate_num_children(self, person: Person, variation: float) -> int:
+        """Calculate number of children based on birth rate plus a random variation (±1.5)."""
+        decade = person.birth_decade
         base_rate = self.data_manager.get_birth_rate(decade)
 
-        # Add random variation ±1.5
-        variation = self.rng.uniform(-1.5, 1.5)
         children = base_rate + variation
 
         # Graduate requirement: single parents have 1 fewer child
@@ -156,27 +164,7 @@ class FamilyTreeGenerator:
         if parent2.year_died:
             end = min(end, parent2.year_died - 1)
 
-        # Apply 2120 limit
-        end = min(end, 2120)
-
-        # Check if valid range exists
-        if start > end:
-            return []
-
-        # Distribute children evenly across the range
-        if num_children == 1:
-            return [(start + end) // 2]
-
-        birth_years = []
-        if num_children > 1:
-            interval = (end - start) / (num_children - 1)
-            for i in range(num_children):
-                year = int(start + i * interval)
-                # Ensure year doesn't exceed end due to rounding
-                year = min(year, end)
-                birth_years.append(year)
-
-        return birth_years
+        return _spread_years(start, end, num_children)
 
     def _distribute_birth_years_single(self, parent: Person, num_children: int) -> List[int]:
         """Distribute birth years for children of a single parent."""
@@ -187,24 +175,22 @@ class FamilyTreeGenerator:
         if parent.year_died:
             end = min(end, parent.year_died - 1)
 
-        # Apply 2120 limit
-        end = min(end, 2120)
+        return _spread_years(start, end, num_children)
 
-        # Check if valid range exists
-        if start > end:
-            return []
 
-        # Distribute children evenly across the range
-        if num_children == 1:
-            return [(start + end) // 2]
+def _spread_years(start: int, end: int, num_children: int) -> List[int]:
+    """Spread num_children birth years evenly over [start, min(end, 2120)]."""
+    # Apply 2120 limit
+    end = min(end, 2120)
+
+    # Check if valid range exists
+    if start > end or num_children <= 0:
+        return []
 
-        birth_years = []
-        if num_children > 1:
-            interval = (end - start) / (num_children - 1)
-            for i in range(num_children):
-                year = int(start + i * interval)
-                # Ensure year doesn't exceed end due to rounding
-                year = min(year, end)
-                birth_years.append(year)
+    if num_children == 1:
+        return [(start + end) // 2]
 
-        return birth_years
+    # Integer steps land exactly on end, so no float rounding to clamp
+    span = end - start
+    last = num_children - 1
+    return [start + (i * span) // last for i in range(num_children)]
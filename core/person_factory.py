@@ -1,5 +1,6 @@
 import random
-from typing import Optional
+import itertools
+from typing import Dict, List, Optional
 from models.person import Person
 from core.data_manager import DataManager
 
@@ -10,7 +11,7 @@ class PersonFactory:
     def __init__(self, seed: Optional[int] = None):
         self.data_manager = DataManager()
         self.rng = random.Random(seed)
-        self.next_id = 1
+        self._id_iter = itertools.count(1)
 
     def create_founder(self) -> Person:
         """Create a founder person born in 1950."""
@@ -30,7 +31,7 @@ class PersonFactory:
         year_died = self._calculate_death_year(year_born)
 
         person = Person(
-            id=self.next_id,
+            id=next(self._id_iter),
             first_name=first_name,
             last_name=last_name,
             gender=gender,
@@ -38,12 +39,10 @@ class PersonFactory:
             year_died=year_died,
             generation=0
         )
-
-        self.next_id += 1
         return person
 
-    def create_child(self, parent1: Person, parent2: Person, year_born: int) -> Person:
-        """Create a child from two parents."""
+    def create_child(self, parent1: Person, parent2: Optional[Person], year_born: int) -> Person:
+        """Create a child from two parents, or from parent1 alone when parent2 is None."""
         decade = f"{(year_born // 10) * 10}s"
 
         # Select gender
@@ -62,7 +61,7 @@ class PersonFactory:
         generation = parent1.generation + 1
 
         person = Person(
-            id=self.next_id,
+            id=next(self._id_iter),
             first_name=first_name,
             last_name=last_name,
             gender=gender,
@@ -72,10 +71,45 @@ class PersonFactory:
             parent1=parent1,
             parent2=parent2
         )
-
-        self.next_id += 1
         return person
 
+    def create_children_batch(self, parent1: Person, parent2: Optional[Person], years: List[int]) -> List[Person]:
+        """Create children from two parents, or from parent1 alone when parent2 is None, sampling per decade in bulk."""
+        # Group birth years by decade so each bucket shares one set of draws
+        buckets: Dict[str, List[int]] = {}
+        for year_born in years:
+            buckets.setdefault(f"{(year_born // 10) * 10}s", []).append(year_born)
+
+        # Inherit last name from parent1 (arbitrary choice)
+        last_name = parent1.last_name
+
+        # Generation is one more than parents
+        generation = parent1.generation + 1
+
+        # Draw every child's death-year variation (uniform ±10) in one batch
+        rng_random = self.rng.random
+        variations = iter([-10.0 + 20.0 * rng_random() for _ in years])
+
+        children = []
+        for decade, bucket_years in buckets.items():
+            genders = self._select_genders(decade, len(bucket_years))
+            first_names = self._select_first_names(decade, genders)
+
+            for year_born, gender, first_name, variation in zip(bucket_years, genders, first_names, variations):
+                children.append(Person(
+                    id=next(self._id_iter),
+                    first_name=first_name,
+                    last_name=last_name,
+                    gender=gender,
+                    year_born=year_born,
+                    year_died=self._death_year(year_born, variation),
+                    generation=generation,
+                    parent1=parent1,
+                    parent2=parent2
+                ))
+
+        return children
+
     def create_partner(self, person: Person) -> Person:
         """Create a partner for a person (born within ±10 years)."""
         # Partner born within ±10 years, but not after 2120
@@ -99,7 +133,7 @@ class PersonFactory:
         generation = person.generation
 
         partner = Person(
-            id=self.next_id,
+            id=next(self._id_iter),
             first_name=first_name,
             last_name=last_name,
             gender=gender,
@@ -107,45 +141,59 @@ class PersonFactory:
             year_died=year_died,
             generation=generation
         )
-
-        self.next_id += 1
         return partner
 
     def _select_gender(self, decade: str) -> str:
         """Select gender based on decade probabilities."""
-        probs = self.data_manager.get_gender_probabilities(decade)
-        return self.rng.choices(
-            ['male', 'female'],
-            weights=[probs['male'], probs['female']],
-            k=1
-        )[0]
+        return 'male' if self.rng.random() < self.data_manager.get_male_probability(decade) else 'female'
 
     def _select_first_name(self, decade: str, gender: str) -> str:
         """Select first name using weighted probabilities."""
-        items = self.data_manager.get_first_names(decade, gender)
-        if not items:
+        names, cum_weights = self.data_manager.get_first_name_cum_weights(decade, gender)
+        if not names:
             # Fallback if no names available
             return "Unknown"
 
-        names, weights = zip(*items)
-        return self.rng.choices(names, weights=weights, k=1)[0]
+        return self.rng.choices(names, cum_weights=cum_weights, k=1)[0]
+
+    def _select_genders(self, decade: str, count: int) -> List[str]:
+        """Select genders for several people born in the same decade."""
+        p_male = self.data_manager.get_male_probability(decade)
+        rng_random = self.rng.random
+        return ['male' if rng_random() < p_male else 'female' for _ in range(count)]
+
+    def _select_first_names(self, decade: str, genders: List[str]) -> List[str]:
+        """Select one first name per entry in genders, drawing each gender's names in one call."""
+        picks = {}
+        for gender in ('male', 'female'):
+            count = genders.count(gender)
+            if not count:
+                continue
+            names, cum_weights = self.data_manager.get_first_name_cum_weights(decade, gender)
+            if names:
+                picks[gender] = iter(self.rng.choices(names, cum_weights=cum_weights, k=count))
+            else:
+                # Fallback if no names available
+                picks[gender] = iter(["Unknown"] * count)
+        return [next(picks[gender]) for gender in genders]
 
     def _select_last_name(self, decade: str) -> str:
         """Select last name using rank probabilities."""
-        items = self.data_manager.get_last_names(decade)
-        if not items:
+        names, _, cum_weights = self.data_manager.get_last_name_weights(decade)
+        if not names:
             # Fallback if no names available
             return "Unknown"
 
-        names, weights = zip(*items)
-        return self.rng.choices(names, weights=weights, k=1)[0]
+        return self.rng.choices(names, cum_weights=cum_weights, k=1)[0]
 
     def _calculate_death_year(self, year_born: int) -> Optional[int]:
         """Calculate death year based on life expectancy."""
-        life_expectancy = self.data_manager.get_life_expectancy(year_born)
-
         # Add random variation ±10 years
-        variation = self.rng.uniform(-10, 10)
+        return self._death_year(year_born, self.rng.uniform(-10, 10))
+
+    def _death_year(self, year_born: int, variation: float) -> Optional[int]:
+        """Calculate death year from life expectancy and a pre-drawn variation."""
+        life_expectancy = self.data_manager.get_life_expectancy(year_born)
         death_year = int(year_born + life_expectancy + variation)
 
         # Don't return death year beyond 2120 (they might still be alive)
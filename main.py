@@ -11,6 +11,7 @@ Graduate student requirements:
 - Single parents have 1 child fewer than partnered parents
 """
 
+from core.data_manager import DataManager
 from core.generator import FamilyTreeGenerator
 from ui.cli import FamilyTreeCLI
 
@@ -18,6 +19,7 @@ from ui.cli import FamilyTreeCLI
 def main():
     """Main entry point for the family tree generator."""
     print("Reading files...")
+    DataManager().load_all()
 
     # Generate the family tree
     print("Generating family tree...")
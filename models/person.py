@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """Represents a person in the family tree."""
     id: int
@@ -15,7 +15,11 @@ class Person:
     parent1: Optional['Person'] = None
     parent2: Optional['Person'] = None
     partner: Optional['Person'] = None
-    children: list['Person'] = field(default_factory=list)
+    birth_decade: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Cache the decade of birth, which never changes after construction."""
+        self.birth_decade = f"{(self.year_born // 10) * 10}s"
 
     def is_alive(self, year: int) -> bool:
         """Check if person is alive in a given year."""
@@ -32,8 +36,7 @@ class Person:
 
     def get_birth_decade(self) -> str:
         """Get the decade of birth (e.g., '1950s')."""
-        decade_start = (self.year_born // 10) * 10
-        return f"{decade_start}s"
+        return self.birth_decade
 
     def get_full_name(self) -> str:
         """Get full name."""
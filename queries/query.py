@@ -1,5 +1,6 @@
-from typing import Dict, List
-from collections import defaultdict, Counter
+from functools import cached_property
+from typing import Dict, List, Tuple
+from collections import Counter
 from core.family_tree import FamilyTree
 
 
@@ -9,30 +10,36 @@ class FamilyTreeQuery:
     def __init__(self, tree: FamilyTree):
         self.tree = tree
 
+    @cached_property
+    def _stats(self) -> Tuple[int, Dict[str, int], List[str]]:
+        """Compute and cache (total, people by decade, duplicate names) from the tree's columns."""
+        total = len(self.tree.years_born)
+
+        # Histogram birth years with Counter's C counting loop, then fold the
+        # (at most a few hundred) distinct years into decades
+        decade_counts = Counter()
+        for year, count in Counter(self.tree.years_born).items():
+            decade_counts[(year // 10) * 10] += count
+
+        name_counter = Counter(zip(self.tree.first_names, self.tree.last_names))
+
+        # Sort by decade
+        by_decade = {f"{decade}s": count for decade, count in sorted(decade_counts.items())}
+
+        # Find duplicates, formatting only those names for display
+        duplicates = sorted(name for name, count in name_counter.items() if count > 1)
+        duplicate_names = [f"{first} {last}" for first, last in duplicates]
+
+        return total, by_decade, duplicate_names
+
     def get_total_people(self) -> int:
         """Get total number of people in the tree."""
-        return self.tree.get_total_count()
+        return self._stats[0]
 
     def get_people_by_decade(self) -> Dict[str, int]:
         """Get count of people born in each decade."""
-        decade_counts = defaultdict(int)
-
-        for person in self.tree.get_all_people():
-            decade = person.get_birth_decade()
-            decade_counts[decade] += 1
-
-        # Sort by decade
-        sorted_decades = sorted(decade_counts.items(), key=lambda x: int(x[0][:-1]))
-        return dict(sorted_decades)
+        return dict(self._stats[1])
 
     def get_duplicate_names(self) -> List[str]:
         """Get list of names that appear more than once."""
-        name_counter = Counter()
-
-        for person in self.tree.get_all_people():
-            full_name = person.get_full_name()
-            name_counter[full_name] += 1
-
-        # Find duplicates
-        duplicates = [name for name, count in name_counter.items() if count > 1]
-        return sorted(duplicates)
+        return list(self._stats[2])